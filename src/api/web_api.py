@@ -1,5 +1,6 @@
 """FastAPI web application for Nexus Dashboard MCP Server management UI."""
 
+import asyncio
 import csv
 import io
 from datetime import datetime
@@ -579,6 +580,23 @@ db = get_db()
 # Global startup time for uptime calculation
 startup_time = datetime.utcnow()
 
+# Background task purging expired sessions
+_session_cleanup_task: Optional[asyncio.Task] = None
+
+
+@app.on_event("startup")
+async def start_session_cleanup():
+    """Start periodic removal of expired user sessions."""
+    global _session_cleanup_task
+    _session_cleanup_task = asyncio.create_task(user_service.run_session_cleanup())
+
+
+@app.on_event("shutdown")
+async def stop_session_cleanup():
+    """Stop the expired session cleanup task."""
+    if _session_cleanup_task:
+        _session_cleanup_task.cancel()
+
 
 # ==================== Authentication Helpers ====================
 
@@ -1429,7 +1447,6 @@ async def get_current_user_info(user: Optional[User] = Depends(get_current_user)
         "user": {
             **user.to_dict(),
             "has_edit_mode": user.has_edit_mode(),
-            "api_token": user.api_token,  # Include for Claude Desktop setup
         },
     }
 
@@ -1483,7 +1500,6 @@ async def initial_setup(user_data: UserCreate, response: Response):
             "user": {
                 **user.to_dict(),
                 "has_edit_mode": user.has_edit_mode(),
-                "api_token": user.api_token,
             },
         }
     except ValueError as e:
@@ -1498,8 +1514,6 @@ async def list_users(
     _user: User = Depends(require_auth),
 ):
     """List all users."""
-    users = await user_service.list_users(active_only=active_only)
-
     return [
         UserResponse(
             id=u.id,
@@ -1515,7 +1529,7 @@ async def list_users(
             roles=[r.to_dict(include_operations=False) for r in u.roles],
             has_edit_mode=u.has_edit_mode(),
         )
-        for u in users
+        async for u in user_service.iter_users(active_only=active_only)
     ]
 
 
@@ -1591,14 +1605,17 @@ async def update_user(
     _admin: User = Depends(require_superuser),
 ):
     """Update user (superuser only)."""
-    user = await user_service.update_user(
-        user_id=user_id,
-        email=user_data.email,
-        display_name=user_data.display_name,
-        is_active=user_data.is_active,
-        is_superuser=user_data.is_superuser,
-        password=user_data.password,
-    )
+    try:
+        user = await user_service.update_user(
+            user_id=user_id,
+            email=user_data.email,
+            display_name=user_data.display_name,
+            is_active=user_data.is_active,
+            is_superuser=user_data.is_superuser,
+            password=user_data.password,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -38,6 +38,7 @@ class Database:
             pool_pre_ping=True,
             pool_size=10,
             max_overflow=20,
+            query_cache_size=1200,
         )
 
         # Create async session factory
@@ -0,0 +1,10 @@
+-- Migration 011: Composite index for session validation
+-- Version: 011
+-- Date: 2026-10-16
+-- Description: Session validation filters on both session_token and expires_at
+--              in a single query, so index the pair. Expired sessions are no
+--              longer deleted inline during validation; they are removed by
+--              UserService.cleanup_expired_sessions.
+
+CREATE INDEX IF NOT EXISTS idx_user_sessions_token_expires
+    ON user_sessions(session_token, expires_at);
@@ -0,0 +1,46 @@
+-- Migration 012: Store SHA-256 digests of API and session tokens
+-- Version: 012
+-- Date: 2026-10-16
+-- Description: API tokens and session tokens are no longer stored in plaintext.
+--              The columns now hold the 32-byte SHA-256 digest of the issued
+--              token; lookups hash the presented token first. Existing tokens
+--              are hashed in place, so tokens already configured in Claude
+--              Desktop and active browser sessions keep working.
+--              Fresh installs already create both columns as BYTEA from
+--              schema.sql, so each conversion only runs while the column is
+--              still VARCHAR.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'users'
+          AND column_name = 'api_token'
+          AND data_type = 'character varying'
+    ) THEN
+        ALTER TABLE users
+            ALTER COLUMN api_token TYPE BYTEA
+                USING sha256(convert_to(api_token, 'UTF8'));
+    END IF;
+END
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'user_sessions'
+          AND column_name = 'session_token'
+          AND data_type = 'character varying'
+    ) THEN
+        ALTER TABLE user_sessions
+            ALTER COLUMN session_token TYPE BYTEA
+                USING sha256(convert_to(session_token, 'UTF8'));
+    END IF;
+END
+$$;
+
+COMMENT ON COLUMN users.api_token IS 'SHA-256 digest of the Claude Desktop API token';
+COMMENT ON COLUMN user_sessions.session_token IS 'SHA-256 digest of the session token';
@@ -69,7 +69,7 @@ CREATE TABLE IF NOT EXISTS users (
     password_hash TEXT NOT NULL,
     email VARCHAR(255),
     display_name VARCHAR(255),
-    api_token VARCHAR(64) UNIQUE,
+    api_token BYTEA UNIQUE,                 -- SHA-256 of the issued token
     is_active BOOLEAN DEFAULT TRUE,
     is_superuser BOOLEAN DEFAULT FALSE,
     auth_type VARCHAR(50) DEFAULT 'local',  -- 'local' or 'ldap'
@@ -114,7 +114,7 @@ CREATE TABLE IF NOT EXISTS user_roles (
 CREATE TABLE IF NOT EXISTS user_sessions (
     id SERIAL PRIMARY KEY,
     user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    session_token VARCHAR(255) NOT NULL UNIQUE,
+    session_token BYTEA NOT NULL UNIQUE,    -- SHA-256 of the issued token
     expires_at TIMESTAMP NOT NULL,
     created_at TIMESTAMP DEFAULT NOW() NOT NULL
 );
@@ -247,6 +247,7 @@ CREATE INDEX IF NOT EXISTS idx_user_roles_role_id ON user_roles(role_id);
 CREATE INDEX IF NOT EXISTS idx_user_sessions_user_id ON user_sessions(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_sessions_session_token ON user_sessions(session_token);
 CREATE INDEX IF NOT EXISTS idx_user_sessions_expires_at ON user_sessions(expires_at);
+CREATE INDEX IF NOT EXISTS idx_user_sessions_token_expires ON user_sessions(session_token, expires_at);
 
 -- User clusters indexes
 CREATE INDEX IF NOT EXISTS idx_user_clusters_user_id ON user_clusters(user_id);
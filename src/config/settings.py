@@ -59,6 +59,12 @@ class Settings(BaseSettings):
         default=30,
         description="Session timeout in minutes"
     )
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor for local user password hashes"
+    )
 
     # Server Configuration
     mcp_server_host: str = Field(
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional, Set, TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import relationship, Mapped
 from sqlalchemy.sql import func
 
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
     from src.models.cluster import Cluster
     from src.models.tool_profile import ToolProfile
 
+# Stored for LDAP users, who never authenticate locally; no bcrypt hash matches it
+UNUSABLE_PASSWORD_HASH = "!"
+
 
 class User(Base):
     """Model for user accounts with authentication."""
@@ -26,7 +29,7 @@ class User(Base):
     password_hash = Column(Text, nullable=False)
     email = Column(String(255), index=True)
     display_name = Column(String(255))
-    api_token = Column(String(64), unique=True, index=True)  # For Claude Desktop auth
+    api_token = Column(LargeBinary(32), unique=True, index=True)  # SHA-256 of Claude Desktop token
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     auth_type = Column(String(50), default="local")  # 'local' or 'ldap'
@@ -172,13 +175,18 @@ class UserSession(Base):
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    session_token = Column(String(255), unique=True, nullable=False, index=True)
+    session_token = Column(LargeBinary(32), unique=True, nullable=False, index=True)  # SHA-256 of token
     expires_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=func.now(), nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="sessions")
 
+    # Lets session validation check token and expiry from the index alone
+    __table_args__ = (
+        Index("idx_user_sessions_token_expires", "session_token", "expires_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<UserSession(user_id={self.user_id}, expires_at={self.expires_at})>"
 
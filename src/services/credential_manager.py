@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.database import get_db
 from src.models import Cluster
+from src.services.user_service import UserService
 from src.utils.encryption import decrypt_password, encrypt_password
 
 
@@ -188,6 +189,7 @@ class CredentialManager:
 
             await session.delete(cluster)
             await session.commit()
+            UserService.clear_auth_cache()
             return True
 
     async def deactivate_cluster(self, name: str) -> bool:
@@ -210,4 +212,5 @@ class CredentialManager:
 
             cluster.is_active = False
             await session.commit()
+            UserService.clear_auth_cache()
             return True
@@ -5,18 +5,19 @@ Local authentication remains the default and is always available.
 """
 
 import logging
-import secrets
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.config.database import get_db
 from src.models.ldap_config import LDAPConfig, LDAPGroupRoleMapping, LDAPGroupClusterMapping
-from src.models.user import User
+from src.models.user import UNUSABLE_PASSWORD_HASH, User
 from src.models.user_cluster import UserCluster
 from src.models.role import Role, UserRole
+from src.services.user_service import UserService
 from src.utils.encryption import encrypt_password, decrypt_password
 
 logger = logging.getLogger(__name__)
@@ -507,16 +508,10 @@ class LDAPService:
                 if not config.auto_create_users:
                     return "skipped"
 
-                # Generate a random password hash (LDAP users can't use local auth)
-                import bcrypt
-                dummy_password = bcrypt.hashpw(
-                    secrets.token_bytes(32),
-                    bcrypt.gensalt()
-                ).decode()
-
+                # LDAP users can't use local auth, so no real hash is needed
                 user = User(
                     username=username,
-                    password_hash=dummy_password,
+                    password_hash=UNUSABLE_PASSWORD_HASH,
                     email=email,
                     display_name=display_name,
                     auth_type="ldap",
@@ -544,60 +539,76 @@ class LDAPService:
         user_id: int,
         config_id: int,
         groups: List[str],
+        session: Optional[AsyncSession] = None,
     ) -> None:
-        """Apply LDAP group to role/cluster mappings for a user."""
-        async with self.db.session() as session:
-            # Get role mappings for this config
-            role_result = await session.execute(
-                select(LDAPGroupRoleMapping).where(
-                    LDAPGroupRoleMapping.ldap_config_id == config_id
+        """Apply LDAP group to role/cluster mappings for a user.
+
+        Args:
+            user_id: User ID
+            config_id: LDAP config ID whose mappings apply
+            groups: Group DNs the user belongs to
+            session: Open session to write in; committed by its owner
+        """
+        if session is None:
+            async with self.db.session() as own_session:
+                await self._apply_group_mappings(
+                    user_id, config_id, groups, session=own_session
                 )
+                await own_session.commit()
+            UserService.clear_auth_cache(user_id)
+            return
+
+        # Get role mappings for this config
+        role_result = await session.execute(
+            select(LDAPGroupRoleMapping).where(
+                LDAPGroupRoleMapping.ldap_config_id == config_id
             )
-            role_mappings = list(role_result.scalars().all())
+        )
+        role_mappings = list(role_result.scalars().all())
 
-            # Get cluster mappings for this config
-            cluster_result = await session.execute(
-                select(LDAPGroupClusterMapping).where(
-                    LDAPGroupClusterMapping.ldap_config_id == config_id
-                )
+        # Get cluster mappings for this config
+        cluster_result = await session.execute(
+            select(LDAPGroupClusterMapping).where(
+                LDAPGroupClusterMapping.ldap_config_id == config_id
             )
-            cluster_mappings = list(cluster_result.scalars().all())
-
-            # Find matching roles
-            role_ids = set()
-            for mapping in role_mappings:
-                if mapping.ldap_group_dn in groups:
-                    role_ids.add(mapping.role_id)
-
-            # Find matching clusters
-            cluster_ids = set()
-            for mapping in cluster_mappings:
-                if mapping.ldap_group_dn in groups:
-                    cluster_ids.add(mapping.cluster_id)
-
-            # Update user roles (add only, don't remove existing)
-            for role_id in role_ids:
-                existing = await session.execute(
-                    select(UserRole).where(
-                        UserRole.user_id == user_id,
-                        UserRole.role_id == role_id
-                    )
-                )
-                if not existing.scalar_one_or_none():
-                    session.add(UserRole(user_id=user_id, role_id=role_id))
-
-            # Update user clusters (add only, don't remove existing)
-            for cluster_id in cluster_ids:
-                existing = await session.execute(
-                    select(UserCluster).where(
-                        UserCluster.user_id == user_id,
-                        UserCluster.cluster_id == cluster_id
-                    )
+        )
+        cluster_mappings = list(cluster_result.scalars().all())
+
+        # Find matching roles
+        role_ids = set()
+        for mapping in role_mappings:
+            if mapping.ldap_group_dn in groups:
+                role_ids.add(mapping.role_id)
+
+        # Find matching clusters
+        cluster_ids = set()
+        for mapping in cluster_mappings:
+            if mapping.ldap_group_dn in groups:
+                cluster_ids.add(mapping.cluster_id)
+
+        # Update user roles (add only, don't remove existing)
+        if role_ids:
+            existing = await session.execute(
+                select(UserRole.role_id).where(UserRole.user_id == user_id)
+            )
+            new_role_ids = role_ids - set(existing.scalars().all())
+            if new_role_ids:
+                await session.execute(
+                    insert(UserRole),
+                    [{"user_id": user_id, "role_id": role_id} for role_id in new_role_ids],
                 )
-                if not existing.scalar_one_or_none():
-                    session.add(UserCluster(user_id=user_id, cluster_id=cluster_id))
 
-            await session.commit()
+        # Update user clusters (add only, don't remove existing)
+        if cluster_ids:
+            existing = await session.execute(
+                select(UserCluster.cluster_id).where(UserCluster.user_id == user_id)
+            )
+            new_cluster_ids = cluster_ids - set(existing.scalars().all())
+            if new_cluster_ids:
+                await session.execute(
+                    insert(UserCluster),
+                    [{"user_id": user_id, "cluster_id": cluster_id} for cluster_id in new_cluster_ids],
+                )
 
     async def _update_sync_status(
         self,
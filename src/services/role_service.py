@@ -10,6 +10,7 @@ from src.config.database import get_db
 from src.models.role import Role, RoleOperation
 from src.models.api_endpoint import APIEndpoint
 from src.models.tool_profile import ToolProfile
+from src.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
@@ -174,6 +175,7 @@ class RoleService:
                 role.tool_profile_id = tool_profile_id if tool_profile_id != 0 else None
 
             await session.commit()
+            UserService.clear_auth_cache()
             await session.refresh(role)
 
             logger.info(f"Updated role: {role.name}")
@@ -204,6 +206,7 @@ class RoleService:
 
             await session.delete(role)
             await session.commit()
+            UserService.clear_auth_cache()
 
             logger.info(f"Deleted role: {role.name}")
             return True
@@ -228,6 +231,7 @@ class RoleService:
 
             role.tool_profile_id = profile_id
             await session.commit()
+            UserService.clear_auth_cache()
             await session.refresh(role)
 
             logger.info(f"Set tool profile {profile_id} for role '{role.name}'")
@@ -266,6 +270,7 @@ class RoleService:
                 session.add(role_op)
 
             await session.commit()
+            UserService.clear_auth_cache()
 
             logger.info(f"Updated operations for role {role.name}: {len(operation_names)} operations")
             return await self.get_role(role_id)
@@ -300,6 +305,7 @@ class RoleService:
                     session.add(role_op)
 
             await session.commit()
+            UserService.clear_auth_cache()
 
             return await self.get_role(role_id)
 
@@ -329,6 +335,7 @@ class RoleService:
                 )
             )
             await session.commit()
+            UserService.clear_auth_cache()
 
             return await self.get_role(role_id)
 
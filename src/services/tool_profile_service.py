@@ -19,6 +19,7 @@ from sqlalchemy import select, delete
 from src.config.database import get_db
 from src.models.tool_profile import ToolProfile, ToolProfileOperation
 from src.models.user import User
+from src.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
@@ -180,6 +181,7 @@ class ToolProfileService:
                 profile.is_active = is_active
 
             await session.commit()
+            UserService.clear_auth_cache()
             await session.refresh(profile)
 
             logger.info(f"Updated tool profile '{profile.name}' (id={profile_id})")
@@ -207,6 +209,7 @@ class ToolProfileService:
 
             await session.delete(profile)
             await session.commit()
+            UserService.clear_auth_cache()
 
             logger.info(f"Deleted tool profile id={profile_id}")
             return True
@@ -252,6 +255,7 @@ class ToolProfileService:
                 )
 
             await session.commit()
+            UserService.clear_auth_cache()
 
             logger.info(
                 f"Set {len(operation_names)} operations on tool profile id={profile_id}"
@@ -294,6 +298,7 @@ class ToolProfileService:
 
             user.tool_profile_id = profile_id
             await session.commit()
+            UserService.clear_auth_cache(user_id)
 
             action = f"assigned profile id={profile_id}" if profile_id else "cleared profile"
             logger.info(f"User id={user_id}: {action}")
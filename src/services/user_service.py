@@ -1,17 +1,25 @@
 """User authentication and management service."""
 
+import asyncio
+import hashlib
 import logging
+import re
 import secrets
-from datetime import datetime, timedelta
-from typing import List, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 
 import bcrypt
-from sqlalchemy import select, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, select, delete, exists, func, insert, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, joinedload
 
 from src.config.database import get_db
-from src.models.user import User, UserSession
-from src.models.role import Role, UserRole
+from src.config.settings import get_settings
+from src.models.user import UNUSABLE_PASSWORD_HASH, User, UserSession
+from src.models.role import UserRole
 from src.models.user_cluster import UserCluster
 from src.models.cluster import Cluster
 
@@ -29,18 +37,152 @@ def get_ldap_service():
     return _ldap_service
 
 
+# Hot authentication queries, built once and reused with bound parameters
+# Roles, clusters and tool profile are small per user, so join them into the
+# lookups; role operations can number in the hundreds and stay selectin
+_USER_ACCESS_LOADS = (
+    joinedload(User.roles),
+    joinedload(User.clusters),
+    joinedload(User.tool_profile),
+)
+_USER_BY_USERNAME = (
+    select(User)
+    .options(*_USER_ACCESS_LOADS)
+    .where(User.username == bindparam("username"))
+)
+_ACTIVE_USER_BY_API_TOKEN = (
+    select(User)
+    .options(*_USER_ACCESS_LOADS)
+    .where(
+        User.api_token == bindparam("api_token"),
+        User.is_active == True,
+    )
+)
+
+# Session validation runs on every web request; the session check and the
+# user load share one statement (and one connection)
+_ACTIVE_USER_BY_SESSION_TOKEN = (
+    select(User, UserSession.expires_at)
+    .join(UserSession, UserSession.user_id == User.id)
+    .options(*_USER_ACCESS_LOADS)
+    .where(
+        UserSession.session_token == bindparam("session_token"),
+        UserSession.expires_at > bindparam("now"),
+        User.is_active == True,
+    )
+)
+
+# Expired sessions are purged in bounded chunks to keep each transaction short
+_EXPIRED_SESSIONS_BATCH_SQL = (
+    "DELETE FROM user_sessions WHERE ctid IN ("
+    "SELECT ctid FROM user_sessions WHERE expires_at < $1 LIMIT $2)"
+)
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime (columns are TIMESTAMP WITHOUT TIME ZONE)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _token_pattern(num_bytes: int, legacy_hex_bytes: int) -> "re.Pattern[str]":
+    """Build a regex matching a url-safe token of num_bytes.
+
+    Hex tokens of legacy_hex_bytes are still accepted so that tokens issued
+    before the switch to url-safe encoding keep working.
+    """
+    urlsafe_len = -(-num_bytes * 4 // 3)
+    return re.compile(f"[A-Za-z0-9_-]{{{urlsafe_len}}}|[0-9a-f]{{{legacy_hex_bytes * 2}}}")
+
+
 class UserService:
     """Service for user authentication and management."""
 
     # Session configuration
-    SESSION_TOKEN_LENGTH = 64  # bytes (128 hex chars)
+    SESSION_TOKEN_LENGTH = 48  # bytes (64 url-safe chars)
     SESSION_EXPIRY_HOURS = 24
-    API_TOKEN_LENGTH = 32  # bytes (64 hex chars)
+    SESSION_EXPIRY_DELTA = timedelta(hours=SESSION_EXPIRY_HOURS)
+    SESSION_CLEANUP_INTERVAL_SECONDS = 300
+    SESSION_CLEANUP_BATCH_SIZE = 1000
+
+    # bcrypt only uses the first 72 bytes; refuse to encode anything huge
+    MAX_PASSWORD_BYTES = 1024
+    API_TOKEN_LENGTH = 24  # bytes (32 url-safe chars)
+
+    # Tokens have a fixed shape; reject anything else before querying.
+    # Older deployments issued hex tokens of 64 (session) / 32 (API) bytes.
+    SESSION_TOKEN_PATTERN = _token_pattern(SESSION_TOKEN_LENGTH, legacy_hex_bytes=64)
+    API_TOKEN_PATTERN = _token_pattern(API_TOKEN_LENGTH, legacy_hex_bytes=32)
+
+    # Cache token -> User lookups briefly to avoid a DB round-trip per request.
+    # Class-level so every UserService in this process sees the same entries
+    # and invalidations. The cache is per process: another worker (e.g. the
+    # second uvicorn started by start-web-api.sh) keeps serving a revoked
+    # token or session from its own cache for up to AUTH_CACHE_TTL_SECONDS.
+    AUTH_CACHE_TTL_SECONDS = 30
+    AUTH_CACHE_MAX_SIZE = 10000
+    _api_token_cache: Dict[str, Tuple[User, float]] = {}
+    _session_cache: Dict[str, Tuple[User, float]] = {}
 
     def __init__(self):
         """Initialize user service."""
         self.db = get_db()
 
+    # ==================== Auth Cache ====================
+
+    @staticmethod
+    def _cache_get(cache: Dict[str, Tuple[User, float]], token: str) -> Optional[User]:
+        """Return a cached user for a token if the entry is still fresh."""
+        entry = cache.get(token)
+        if entry is None:
+            return None
+        user, expires = entry
+        if time.monotonic() >= expires:
+            cache.pop(token, None)
+            return None
+        return user
+
+    @classmethod
+    def _cache_put(
+        cls,
+        cache: Dict[str, Tuple[User, float]],
+        token: str,
+        user: User,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Store a user for a token, evicting the oldest entry when full."""
+        if ttl is None:
+            ttl = cls.AUTH_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            return
+        if token not in cache and len(cache) >= cls.AUTH_CACHE_MAX_SIZE:
+            cache.pop(next(iter(cache)), None)
+        cache[token] = (user, time.monotonic() + ttl)
+
+    @classmethod
+    def _invalidate_user_cache(cls, user_id: int) -> None:
+        """Drop all cached token lookups for a user."""
+        for cache in (cls._api_token_cache, cls._session_cache):
+            stale = [token for token, (user, _) in cache.items() if user.id == user_id]
+            for token in stale:
+                cache.pop(token, None)
+
+    @classmethod
+    def clear_auth_cache(cls, user_id: Optional[int] = None) -> None:
+        """Drop cached token and session lookups after a permission change.
+
+        Call this after committing changes outside UserService that alter a
+        cached User graph (roles, role operations, tool profiles, LDAP group
+        mappings).
+
+        Args:
+            user_id: Only drop entries for this user; clear everything if None
+        """
+        if user_id is not None:
+            cls._invalidate_user_cache(user_id)
+            return
+        cls._api_token_cache.clear()
+        cls._session_cache.clear()
+
     # ==================== Password Hashing ====================
 
     @staticmethod
@@ -52,9 +194,33 @@ class UserService:
 
         Returns:
             Hashed password string
+
+        Raises:
+            ValueError: If the password exceeds MAX_PASSWORD_BYTES
         """
-        salt = bcrypt.gensalt(rounds=12)
-        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+        if len(password) > UserService.MAX_PASSWORD_BYTES:
+            raise ValueError("Password too long")
+        encoded = password.encode("utf-8")
+        if len(encoded) > UserService.MAX_PASSWORD_BYTES:
+            raise ValueError("Password too long")
+        salt = bcrypt.gensalt(rounds=get_settings().bcrypt_rounds)
+        return bcrypt.hashpw(encoded, salt).decode("utf-8")
+
+    @staticmethod
+    def password_needs_rehash(password_hash: str) -> bool:
+        """Check if a stored hash uses a lower cost than the configured one.
+
+        Args:
+            password_hash: Stored bcrypt hash ($2b$NN$...)
+
+        Returns:
+            True if the hash should be upgraded to the current cost
+        """
+        try:
+            rounds = int(password_hash.split("$")[2])
+        except (AttributeError, IndexError, ValueError):
+            return False
+        return rounds < get_settings().bcrypt_rounds
 
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
@@ -67,8 +233,14 @@ class UserService:
         Returns:
             True if password matches, False otherwise
         """
+        # Characters are at least one byte each, so this skips encoding huge input
+        if len(password) > UserService.MAX_PASSWORD_BYTES:
+            return False
+        encoded = password.encode("utf-8")
+        if len(encoded) > UserService.MAX_PASSWORD_BYTES:
+            return False
         try:
-            return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+            return bcrypt.checkpw(encoded, password_hash.encode("utf-8"))
         except Exception as e:
             logger.error(f"Password verification error: {e}")
             return False
@@ -80,18 +252,33 @@ class UserService:
         """Generate a secure session token.
 
         Returns:
-            Random hex string token
+            Random url-safe token string
         """
-        return secrets.token_hex(UserService.SESSION_TOKEN_LENGTH)
+        return secrets.token_urlsafe(UserService.SESSION_TOKEN_LENGTH)
+
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        """Hash a session or API token for storage and lookup.
+
+        Tokens are high-entropy random values, so a fast unsalted hash is
+        sufficient; only the digest is stored in the database.
+
+        Args:
+            token: Plain token string
+
+        Returns:
+            32-byte SHA-256 digest
+        """
+        return hashlib.sha256(token.encode("utf-8")).digest()
 
     @staticmethod
     def generate_api_token() -> str:
         """Generate a secure API token for Claude Desktop auth.
 
         Returns:
-            Random hex string token
+            Random url-safe token string
         """
-        return secrets.token_hex(UserService.API_TOKEN_LENGTH)
+        return secrets.token_urlsafe(UserService.API_TOKEN_LENGTH)
 
     # ==================== User CRUD ====================
 
@@ -113,6 +300,8 @@ class UserService:
             display_name: Optional display name
             is_superuser: If True, user has all permissions
             generate_api_token: If True, generate API token for Claude Desktop
+                (only its hash is stored; use regenerate_api_token to obtain
+                a token that can be shown to the user)
 
         Returns:
             Created User instance
@@ -120,26 +309,40 @@ class UserService:
         Raises:
             ValueError: If username already exists
         """
+        # Reject duplicates before paying for bcrypt
         async with self.db.session() as session:
-            # Check if username exists
-            result = await session.execute(
-                select(User).where(User.username == username)
+            taken = await session.scalar(
+                select(exists().where(User.username == username))
             )
-            if result.scalar_one_or_none():
-                raise ValueError(f"Username '{username}' already exists")
+        if taken:
+            raise ValueError(f"Username '{username}' already exists")
 
-            # Create user
+        # bcrypt is CPU-bound; keep it off the event loop and out of the transaction
+        password_hash = await asyncio.to_thread(self.hash_password, password)
+
+        async with self.db.session() as session:
             user = User(
                 username=username,
-                password_hash=self.hash_password(password),
+                password_hash=password_hash,
                 email=email,
                 display_name=display_name or username,
                 is_superuser=is_superuser,
-                api_token=self.generate_api_token() if generate_api_token else None,
+                api_token=(
+                    self.hash_token(self.generate_api_token()) if generate_api_token else None
+                ),
+                # A new user has no relations yet; mark them loaded so no
+                # refresh is needed once the session is closed
+                roles=[],
+                sessions=[],
+                clusters=[],
+                tool_profile=None,
             )
             session.add(user)
-            await session.commit()
-            await session.refresh(user)
+            try:
+                await session.commit()
+            except IntegrityError as e:
+                # Lost a race with a concurrent create of the same username
+                raise ValueError(f"Username '{username}' already exists") from e
 
             logger.info(f"Created user: {username}")
             return user
@@ -155,12 +358,7 @@ class UserService:
         """
         async with self.db.session() as session:
             result = await session.execute(
-                select(User)
-                .options(
-                    selectinload(User.roles).selectinload(Role.operations),
-                    selectinload(User.clusters),
-                )
-                .where(User.id == user_id)
+                select(User).where(User.id == user_id)
             )
             return result.scalar_one_or_none()
 
@@ -174,15 +372,8 @@ class UserService:
             User instance or None if not found
         """
         async with self.db.session() as session:
-            result = await session.execute(
-                select(User)
-                .options(
-                    selectinload(User.roles).selectinload(Role.operations),
-                    selectinload(User.clusters),
-                )
-                .where(User.username == username)
-            )
-            return result.scalar_one_or_none()
+            result = await session.execute(_USER_BY_USERNAME, {"username": username})
+            return result.unique().scalar_one_or_none()
 
     async def get_user_by_api_token(self, api_token: str) -> Optional[User]:
         """Get user by API token (for Claude Desktop auth).
@@ -193,40 +384,86 @@ class UserService:
         Returns:
             User instance or None if not found or inactive
         """
-        if not api_token:
+        if not api_token or not self.API_TOKEN_PATTERN.fullmatch(api_token):
             return None
 
+        cached = self._cache_get(self._api_token_cache, api_token)
+        if cached is not None:
+            return cached
+
         async with self.db.session() as session:
             result = await session.execute(
-                select(User)
-                .options(
-                    selectinload(User.roles).selectinload(Role.operations),
-                    selectinload(User.clusters),
-                )
-                .where(User.api_token == api_token, User.is_active == True)
+                _ACTIVE_USER_BY_API_TOKEN, {"api_token": self.hash_token(api_token)}
             )
-            return result.scalar_one_or_none()
+            user = result.unique().scalar_one_or_none()
+
+        if user:
+            self._cache_put(self._api_token_cache, api_token, user)
+        return user
 
-    async def list_users(self, active_only: bool = False) -> List[User]:
+    async def list_users(
+        self,
+        active_only: bool = False,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Union[List[User], List[Row]]:
         """List all users.
 
         Args:
             active_only: If True, only return active users
+            columns: If provided, select only these User columns and return
+                rows instead of User instances (no relationships are loaded)
+            limit: Maximum number of users to return (all if None)
+            offset: Number of users to skip, ordered by username
 
         Returns:
-            List of User instances
+            List of User instances, or rows of the requested columns
         """
+        if not columns:
+            return [
+                user
+                async for user in self.iter_users(
+                    active_only=active_only, limit=limit, offset=offset
+                )
+            ]
+
         async with self.db.session() as session:
-            query = select(User).options(
-                selectinload(User.roles),
-                selectinload(User.clusters),
-            )
+            query = select(*columns)
             if active_only:
                 query = query.where(User.is_active == True)
-            query = query.order_by(User.username)
+            query = query.order_by(User.username).limit(limit).offset(offset)
 
             result = await session.execute(query)
-            return list(result.scalars().all())
+            return list(result.all())
+
+    async def iter_users(
+        self,
+        active_only: bool = False,
+        batch_size: int = 1000,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> AsyncIterator[User]:
+        """Stream users ordered by username in fixed-size batches.
+
+        Args:
+            active_only: If True, only yield active users
+            batch_size: Number of users fetched (with relations) per batch
+            limit: Maximum number of users to yield (all if None)
+            offset: Number of users to skip
+
+        Yields:
+            User instances
+        """
+        query = select(User).execution_options(yield_per=batch_size)
+        if active_only:
+            query = query.where(User.is_active == True)
+        query = query.order_by(User.username).limit(limit).offset(offset)
+
+        async with self.db.session() as session:
+            result = await session.stream_scalars(query)
+            async for user in result:
+                yield user
 
     async def update_user(
         self,
@@ -250,28 +487,35 @@ class UserService:
         Returns:
             Updated User instance or None if not found
         """
+        values = {}
+        if email is not None:
+            values["email"] = email
+        if display_name is not None:
+            values["display_name"] = display_name
+        if is_active is not None:
+            values["is_active"] = is_active
+        if is_superuser is not None:
+            values["is_superuser"] = is_superuser
+        if password is not None:
+            values["password_hash"] = await asyncio.to_thread(self.hash_password, password)
+
+        if not values:
+            return await self.get_user(user_id)
+
         async with self.db.session() as session:
             result = await session.execute(
-                select(User).where(User.id == user_id)
+                update(User)
+                .where(User.id == user_id)
+                .values(**values)
+                .returning(User)
             )
             user = result.scalar_one_or_none()
             if not user:
                 return None
 
-            if email is not None:
-                user.email = email
-            if display_name is not None:
-                user.display_name = display_name
-            if is_active is not None:
-                user.is_active = is_active
-            if is_superuser is not None:
-                user.is_superuser = is_superuser
-            if password is not None:
-                user.password_hash = self.hash_password(password)
-
             await session.commit()
-            await session.refresh(user)
 
+            self._invalidate_user_cache(user_id)
             logger.info(f"Updated user: {user.username}")
             return user
 
@@ -284,18 +528,19 @@ class UserService:
         Returns:
             True if deleted, False if not found
         """
+        # Sessions, role and cluster assignments are removed by ON DELETE CASCADE
         async with self.db.session() as session:
             result = await session.execute(
-                select(User).where(User.id == user_id)
+                delete(User).where(User.id == user_id).returning(User.username)
             )
-            user = result.scalar_one_or_none()
-            if not user:
+            username = result.scalar_one_or_none()
+            if username is None:
                 return False
 
-            await session.delete(user)
             await session.commit()
 
-            logger.info(f"Deleted user: {user.username}")
+            self._invalidate_user_cache(user_id)
+            logger.info(f"Deleted user: {username}")
             return True
 
     async def regenerate_api_token(self, user_id: int) -> Optional[str]:
@@ -307,19 +552,24 @@ class UserService:
         Returns:
             New API token or None if user not found
         """
+        new_token = self.generate_api_token()
+
         async with self.db.session() as session:
             result = await session.execute(
-                select(User).where(User.id == user_id)
+                update(User)
+                .where(User.id == user_id)
+                .values(api_token=self.hash_token(new_token))
+                .returning(User.username)
             )
-            user = result.scalar_one_or_none()
-            if not user:
+            username = result.scalar_one_or_none()
+            if username is None:
                 return None
 
-            user.api_token = self.generate_api_token()
             await session.commit()
 
-            logger.info(f"Regenerated API token for user: {user.username}")
-            return user.api_token
+            self._invalidate_user_cache(user_id)
+            logger.info(f"Regenerated API token for user: {username}")
+            return new_token
 
     # ==================== Authentication ====================
 
@@ -338,26 +588,32 @@ class UserService:
         Returns:
             User instance if authenticated, None otherwise
         """
-        # Step 1: Try local authentication first
-        user = await self.get_user_by_username(username)
+        # Step 1: Try local authentication first. The lookup's session is
+        # closed before bcrypt runs so no pooled connection sits idle in a
+        # transaction while hashing; last_login is then a single UPDATE.
+        async with self.db.session() as session:
+            result = await session.execute(_USER_BY_USERNAME, {"username": username})
+            user = result.unique().scalar_one_or_none()
+
+        if user and user.is_active and user.auth_type == "local":
+            if not await asyncio.to_thread(self.verify_password, password, user.password_hash):
+                logger.warning(f"Authentication failed: invalid password for local user '{username}'")
+                return None
+
+            new_hash = None
+            if self.password_needs_rehash(user.password_hash):
+                new_hash = await asyncio.to_thread(self.hash_password, password)
+            await self._update_last_login(user.id, password_hash=new_hash)
+            logger.info(f"Local user authenticated: {username}")
+            return user
 
         if user:
             if not user.is_active:
                 logger.warning(f"Authentication failed: user '{username}' is inactive")
                 return None
 
-            # For local users, verify password directly
-            if user.auth_type == "local":
-                if self.verify_password(password, user.password_hash):
-                    await self._update_last_login(user.id)
-                    logger.info(f"Local user authenticated: {username}")
-                    return user
-                else:
-                    logger.warning(f"Authentication failed: invalid password for local user '{username}'")
-                    return None
-
             # For LDAP users, verify against LDAP
-            elif user.auth_type == "ldap":
+            if user.auth_type == "ldap":
                 ldap_service = get_ldap_service()
                 if ldap_service.is_available():
                     success, user_info = await ldap_service.authenticate(username, password)
@@ -387,16 +643,27 @@ class UserService:
         logger.warning(f"Authentication failed: user '{username}' not found")
         return None
 
-    async def _update_last_login(self, user_id: int) -> None:
-        """Update last login timestamp for user."""
+    async def _update_last_login(
+        self,
+        user_id: int,
+        password_hash: Optional[str] = None,
+    ) -> None:
+        """Update last login timestamp for user.
+
+        Args:
+            user_id: User ID
+            password_hash: Upgraded password hash to store (if provided)
+        """
+        values = {"last_login": _utcnow()}
+        if password_hash is not None:
+            values["password_hash"] = password_hash
+
         async with self.db.session() as session:
-            result = await session.execute(
-                select(User).where(User.id == user_id)
-            )
-            db_user = result.scalar_one_or_none()
-            if db_user:
-                db_user.last_login = datetime.utcnow()
-                await session.commit()
+            await session.execute(update(User).where(User.id == user_id).values(**values))
+            await session.commit()
+
+        if password_hash is not None:
+            logger.info(f"Upgraded password hash cost for user {user_id}")
 
     async def _create_ldap_user(self, user_info: dict) -> Optional[User]:
         """Create a local user from LDAP authentication info.
@@ -409,25 +676,20 @@ class UserService:
         """
         try:
             async with self.db.session() as session:
-                # Generate a random password hash (LDAP users can't use local auth)
-                dummy_password = self.hash_password(secrets.token_hex(32))
-
+                # LDAP users can't use local auth, so no real hash is needed
                 user = User(
                     username=user_info["username"],
-                    password_hash=dummy_password,
+                    password_hash=UNUSABLE_PASSWORD_HASH,
                     email=user_info.get("email"),
                     display_name=user_info.get("display_name") or user_info["username"],
                     auth_type="ldap",
                     ldap_dn=user_info.get("dn"),
                     ldap_config_id=user_info.get("ldap_config_id"),
                     is_active=True,
-                    api_token=self.generate_api_token(),
+                    api_token=self.hash_token(self.generate_api_token()),
                 )
                 session.add(user)
-                await session.commit()
-                await session.refresh(user)
-
-                logger.info(f"Created LDAP user: {user_info['username']}")
+                await session.flush()
 
                 # Apply group mappings if groups provided
                 if user_info.get("groups") and user_info.get("ldap_config_id"):
@@ -436,9 +698,17 @@ class UserService:
                         user.id,
                         user_info["ldap_config_id"],
                         user_info["groups"],
+                        session=session,
                     )
 
-                return await self.get_user(user.id)
+                await session.commit()
+                # Load the mapped relationships in the same session
+                await session.refresh(
+                    user, attribute_names=["roles", "sessions", "clusters", "tool_profile"]
+                )
+
+                logger.info(f"Created LDAP user: {user_info['username']}")
+                return user
         except Exception as e:
             logger.error(f"Failed to create LDAP user: {e}")
             return None
@@ -455,12 +725,12 @@ class UserService:
             Session token string
         """
         token = self.generate_session_token()
-        expires_at = datetime.utcnow() + timedelta(hours=self.SESSION_EXPIRY_HOURS)
+        expires_at = _utcnow() + self.SESSION_EXPIRY_DELTA
 
         async with self.db.session() as session:
             user_session = UserSession(
                 user_id=user.id,
-                session_token=token,
+                session_token=self.hash_token(token),
                 expires_at=expires_at,
             )
             session.add(user_session)
@@ -478,31 +748,34 @@ class UserService:
         Returns:
             User instance if valid, None otherwise
         """
-        if not token:
+        if not token or not self.SESSION_TOKEN_PATTERN.fullmatch(token):
             return None
 
+        cached = self._cache_get(self._session_cache, token)
+        if cached is not None:
+            return cached
+
+        # Missing or expired; expired rows are removed by cleanup_expired_sessions
+        now = _utcnow()
         async with self.db.session() as session:
             result = await session.execute(
-                select(UserSession)
-                .options(selectinload(UserSession.user).selectinload(User.roles).selectinload(Role.operations))
-                .where(UserSession.session_token == token)
+                _ACTIVE_USER_BY_SESSION_TOKEN,
+                {"session_token": self.hash_token(token), "now": now},
             )
-            user_session = result.scalar_one_or_none()
-
-            if not user_session:
-                return None
-
-            if user_session.is_expired():
-                # Clean up expired session
-                await session.delete(user_session)
-                await session.commit()
-                logger.debug(f"Cleaned up expired session")
-                return None
-
-            if not user_session.user.is_active:
-                return None
-
-            return user_session.user
+            row = result.unique().first()
+        if not row:
+            return None
+        user, expires_at = row
+
+        # Never cache a session past its own expiry
+        remaining = (expires_at - now).total_seconds()
+        self._cache_put(
+            self._session_cache,
+            token,
+            user,
+            ttl=min(self.AUTH_CACHE_TTL_SECONDS, remaining),
+        )
+        return user
 
     async def invalidate_session(self, token: str) -> bool:
         """Invalidate (logout) a session.
@@ -513,18 +786,17 @@ class UserService:
         Returns:
             True if session was found and deleted
         """
+        self._session_cache.pop(token, None)
+
         async with self.db.session() as session:
             result = await session.execute(
-                select(UserSession).where(UserSession.session_token == token)
+                delete(UserSession).where(UserSession.session_token == self.hash_token(token))
             )
-            user_session = result.scalar_one_or_none()
+            await session.commit()
 
-            if not user_session:
+            if result.rowcount == 0:
                 return False
 
-            await session.delete(user_session)
-            await session.commit()
-
             logger.info("Session invalidated")
             return True
 
@@ -544,25 +816,51 @@ class UserService:
             await session.commit()
 
             count = result.rowcount
+            self._invalidate_user_cache(user_id)
             logger.info(f"Invalidated {count} sessions for user {user_id}")
             return count
 
-    async def cleanup_expired_sessions(self) -> int:
+    async def cleanup_expired_sessions(self, batch_size: Optional[int] = None) -> int:
         """Remove all expired sessions from database.
 
+        Sessions are deleted in batches, each in its own transaction, so a
+        large backlog never holds locks for long.
+
+        Args:
+            batch_size: Rows deleted per batch (defaults to SESSION_CLEANUP_BATCH_SIZE)
+
         Returns:
             Number of sessions cleaned up
         """
-        async with self.db.session() as session:
-            result = await session.execute(
-                delete(UserSession).where(UserSession.expires_at < datetime.utcnow())
-            )
-            await session.commit()
+        batch_size = batch_size or self.SESSION_CLEANUP_BATCH_SIZE
+        now = _utcnow()
+        count = 0
+        while True:
+            async with self.db.async_engine.begin() as conn:
+                result = await conn.exec_driver_sql(
+                    _EXPIRED_SESSIONS_BATCH_SQL, (now, batch_size)
+                )
+            count += result.rowcount
+            if result.rowcount < batch_size:
+                break
 
-            count = result.rowcount
-            if count > 0:
-                logger.info(f"Cleaned up {count} expired sessions")
-            return count
+        if count > 0:
+            logger.info(f"Cleaned up {count} expired sessions")
+        return count
+
+    async def run_session_cleanup(self, interval: Optional[float] = None) -> None:
+        """Remove expired sessions periodically until cancelled.
+
+        Args:
+            interval: Seconds between runs (defaults to SESSION_CLEANUP_INTERVAL_SECONDS)
+        """
+        interval = interval or self.SESSION_CLEANUP_INTERVAL_SECONDS
+        while True:
+            try:
+                await self.cleanup_expired_sessions()
+            except Exception as e:
+                logger.error(f"Expired session cleanup failed: {e}")
+            await asyncio.sleep(interval)
 
     # ==================== Role Assignment ====================
 
@@ -577,29 +875,38 @@ class UserService:
             Updated User instance or None if user not found
         """
         async with self.db.session() as session:
-            # Get user
-            result = await session.execute(
-                select(User).where(User.id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            if not user:
-                return None
-
             # Remove existing role assignments
             await session.execute(
                 delete(UserRole).where(UserRole.user_id == user_id)
             )
 
-            # Add new role assignments
-            for role_id in role_ids:
-                user_role = UserRole(user_id=user_id, role_id=role_id)
-                session.add(user_role)
+            # Add new role assignments; the users FK rejects an unknown user
+            if role_ids:
+                try:
+                    await session.execute(
+                        insert(UserRole),
+                        [{"user_id": user_id, "role_id": role_id} for role_id in role_ids],
+                    )
+                except IntegrityError:
+                    await session.rollback()
+                    if not await self._user_exists(session, user_id):
+                        return None
+                    raise
+            elif not await self._user_exists(session, user_id):
+                return None
 
             await session.commit()
+            self._invalidate_user_cache(user_id)
 
             # Reload user with roles
             return await self.get_user(user_id)
 
+    @staticmethod
+    async def _user_exists(session: AsyncSession, user_id: int) -> bool:
+        """Check whether a user ID exists without loading the user."""
+        result = await session.execute(select(exists().where(User.id == user_id)))
+        return bool(result.scalar())
+
     async def count_users(self) -> int:
         """Get total number of users.
 
@@ -607,8 +914,8 @@ class UserService:
             User count
         """
         async with self.db.session() as session:
-            result = await session.execute(select(User))
-            return len(list(result.scalars().all()))
+            result = await session.execute(select(func.count()).select_from(User))
+            return result.scalar_one()
 
     async def has_any_users(self) -> bool:
         """Check if any users exist in the system.
@@ -617,8 +924,8 @@ class UserService:
             True if at least one user exists
         """
         async with self.db.session() as session:
-            result = await session.execute(select(User).limit(1))
-            return result.scalar_one_or_none() is not None
+            result = await session.execute(select(exists().select_from(User)))
+            return bool(result.scalar())
 
     # ==================== Cluster Assignment ====================
 
@@ -633,25 +940,28 @@ class UserService:
             Updated User instance or None if user not found
         """
         async with self.db.session() as session:
-            # Verify user exists
-            result = await session.execute(
-                select(User).where(User.id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            if not user:
-                return None
-
             # Remove existing cluster assignments
             await session.execute(
                 delete(UserCluster).where(UserCluster.user_id == user_id)
             )
 
-            # Add new cluster assignments
-            for cluster_id in cluster_ids:
-                user_cluster = UserCluster(user_id=user_id, cluster_id=cluster_id)
-                session.add(user_cluster)
+            # Add new cluster assignments; the users FK rejects an unknown user
+            if cluster_ids:
+                try:
+                    await session.execute(
+                        insert(UserCluster),
+                        [{"user_id": user_id, "cluster_id": cluster_id} for cluster_id in cluster_ids],
+                    )
+                except IntegrityError:
+                    await session.rollback()
+                    if not await self._user_exists(session, user_id):
+                        return None
+                    raise
+            elif not await self._user_exists(session, user_id):
+                return None
 
             await session.commit()
+            self._invalidate_user_cache(user_id)
 
             logger.info(f"Assigned {len(cluster_ids)} clusters to user {user_id}")
 
@@ -701,6 +1011,7 @@ class UserService:
             user_cluster = UserCluster(user_id=user_id, cluster_id=cluster_id)
             session.add(user_cluster)
             await session.commit()
+            self._invalidate_user_cache(user_id)
 
             logger.info(f"Added cluster {cluster_id} to user {user_id}")
             return True
@@ -725,6 +1036,7 @@ class UserService:
             await session.commit()
 
             if result.rowcount > 0:
+                self._invalidate_user_cache(user_id)
                 logger.info(f"Removed cluster {cluster_id} from user {user_id}")
                 return True
             return False
@@ -1,5 +1,7 @@
 """Encryption utilities for secure credential storage."""
 
+from functools import lru_cache
+
 from cryptography.fernet import Fernet
 
 from src.config.settings import get_settings
@@ -14,8 +16,9 @@ def generate_encryption_key() -> bytes:
     return Fernet.generate_key()
 
 
+@lru_cache(maxsize=1)
 def get_fernet() -> Fernet:
-    """Get Fernet instance with encryption key from settings.
+    """Get cached Fernet instance with encryption key from settings.
 
     Returns:
         Fernet instance
@@ -28,6 +31,11 @@ def get_fernet() -> Fernet:
     return Fernet(key)
 
 
+def reset_fernet_cache() -> None:
+    """Discard the cached Fernet instance (e.g. after key rotation)."""
+    get_fernet.cache_clear()
+
+
 def encrypt_password(password: str) -> str:
     """Encrypt a password using Fernet symmetric encryption.
 
@@ -1,7 +1,18 @@
 """Validation utilities for input validation."""
 
 import re
-from urllib.parse import urlparse
+
+# Scheme followed by "://" and a non-empty network location
+_URL_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.\-]*://[^\s/?#]+")
+
+# Operation IDs should be alphanumeric with underscores/hyphens
+_OPERATION_ID_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"})
+
+# Control characters stripped from log messages (tab, newline and CR are kept)
+_CONTROL_CHARS = {c: None for c in range(32) if chr(c) not in "\n\r\t"}
+_CONTROL_CHARS[0x7F] = None
 
 
 def validate_url(url: str) -> bool:
@@ -13,11 +24,9 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid URL, False otherwise
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
+    if not isinstance(url, str):
         return False
+    return bool(_URL_RE.match(url))
 
 
 def validate_http_method(method: str) -> bool:
@@ -29,8 +38,7 @@ def validate_http_method(method: str) -> bool:
     Returns:
         True if valid HTTP method, False otherwise
     """
-    valid_methods = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
-    return method.upper() in valid_methods
+    return method.upper() in _HTTP_METHODS
 
 
 def validate_operation_id(operation_id: str) -> bool:
@@ -42,9 +50,7 @@ def validate_operation_id(operation_id: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Operation IDs should be alphanumeric with underscores/hyphens
-    pattern = r"^[a-zA-Z0-9_-]+$"
-    return bool(re.match(pattern, operation_id))
+    return bool(_OPERATION_ID_RE.match(operation_id))
 
 
 def sanitize_log_message(message: str, max_length: int = 1000) -> str:
@@ -61,7 +67,7 @@ def sanitize_log_message(message: str, max_length: int = 1000) -> str:
         return ""
 
     # Remove null bytes and control characters
-    sanitized = "".join(char for char in message if ord(char) >= 32 or char in "\n\r\t")
+    sanitized = message.translate(_CONTROL_CHARS)
 
     # Truncate to max length
     if len(sanitized) > max_length:
@@ -107,7 +107,6 @@ export interface User {
   roles: Role[];
   clusters: { id: number; name: string }[];
   has_edit_mode: boolean;
-  api_token?: string;  // Only returned for current user
   tool_profile_id?: number | null;
   tool_profile?: { id: number; name: string } | null;
 }